@@ -0,0 +1,126 @@
+# serve_workers.py
+# Mide el rendimiento del servidor de producción variando la cantidad de workers.
+# Requiere la base de datos configurada en src/app.py (o DATABASE_URL) y un
+# usuario para iniciar sesión, ya que la API exige sesión. Uso, desde la raíz:
+#   python benchmarks/serve_workers.py --workers 1 2 4 8 --path /api/v1/rooms
+import argparse
+import http.client
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wait_until_ready(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/ready')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'El servidor en el puerto {port} no respondió a tiempo')
+
+
+def _session_cookie(response):
+    cookie = response.getheader('Set-Cookie')
+    return cookie.split(';', 1)[0] if cookie else None
+
+
+def login(port, username, password):
+    """Inicia sesión con el formulario de /login y devuelve la cookie de sesión."""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('GET', '/login')
+    response = conn.getresponse()
+    html = response.read().decode('utf-8')
+    cookie = _session_cookie(response)
+    match = re.search(r'name="csrf_token" type="hidden" value="([^"]+)"', html)
+
+    form = {'username': username, 'password': password, 'csrf_token': match.group(1) if match else ''}
+    conn.request('POST', '/login', body=urlencode(form), headers={
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'Cookie': cookie or '',
+    })
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    if response.status != 302 or _session_cookie(response) is None:
+        raise RuntimeError(f'No se pudo iniciar sesión como {username}')
+    return _session_cookie(response)
+
+
+def client(port, path, cookie, duration, results):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    requests = errors = 0
+    deadline = time.time() + duration
+    while time.time() < deadline:
+        try:
+            conn.request('GET', path, headers={'Accept-Encoding': 'gzip', 'Cookie': cookie})
+            response = conn.getresponse()
+            response.read()
+            if response.status == 200:
+                requests += 1
+            else:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+    results.put((requests, errors))
+
+
+def run(workers, threads, port, path, credentials, clients, duration):
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'src.serve', '--bind', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(port)
+        cookie = login(port, *credentials)
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=client, args=(port, path, cookie, duration, results)) for _ in range(clients)]
+        for process in processes:
+            process.start()
+        totals = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        server.terminate()
+        server.wait()
+
+    requests = sum(r for r, _ in totals)
+    errors = sum(e for _, e in totals)
+    return requests / duration, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rendimiento según cantidad de workers')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, multiprocessing.cpu_count()])
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--path', default='/api/v1/rooms')
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin')
+    parser.add_argument('--clients', type=int, default=multiprocessing.cpu_count() * 2)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f'GET {args.path}, {args.clients} clientes, {args.duration:.0f}s por corrida')
+    print(f'{"workers":>8} {"req/s":>10} {"escala":>8} {"errores":>8}')
+    baseline = None
+    for workers in args.workers:
+        throughput, errors = run(workers, args.threads, args.port, args.path, (args.username, args.password), args.clients, args.duration)
+        baseline = baseline or throughput
+        print(f'{workers:>8} {throughput:>10.1f} {throughput / baseline if baseline else 0:>7.2f}x {errors:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+# api.py
+import json
+from datetime import date, datetime
+from functools import wraps
+
+from flask import Response, abort, jsonify, make_response, request, stream_with_context
+from flask_login import current_user
+
+from .app import app, db
+from .cache import conditional, current_role
+from .models import Room, RoomCategory, Reservation
+
+
+API_PREFIX = '/api/v1'
+
+# Campos expuestos por cada recurso y la columna de la que se obtienen. Se
+# consultan solo las columnas pedidas, sin instanciar los modelos.
+ROOM_FIELDS = {
+    'id': Room.id,
+    'number': Room.number,
+    'status': Room.status,
+    'name': Room.name,
+    'description': Room.description,
+    'category_id': Room.category_id,
+    'category': RoomCategory.name,
+}
+
+CATEGORY_FIELDS = {
+    'id': RoomCategory.id,
+    'name': RoomCategory.name,
+    'description': RoomCategory.description,
+    'max_capacity': RoomCategory.max_capacity,
+}
+
+RESERVATION_FIELDS = {
+    'id': Reservation.id,
+    'user_id': Reservation.user_id,
+    'room_id': Reservation.room_id,
+    'room_number': Room.number,
+    'status': Reservation.status,
+    'check_in': Reservation.check_in,
+    'check_out': Reservation.check_out,
+    'num_people': Reservation.num_people,
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Tipo no serializable: {type(value).__name__}')
+
+
+_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=_json_default)
+
+
+def _json_response(payload, status=200):
+    return Response(_encoder.encode(payload), status=status, mimetype='application/json')
+
+
+def _error(message, status, **extra):
+    abort(make_response(jsonify(error=message, **extra), status))
+
+
+def api_login_required(view):
+    """Como login_required, pero responde 401 en JSON en lugar de redirigir.
+    Usa current_role() para no cargar el usuario al responder un 304."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_role() == 'anonymous':
+            _error('Autenticación requerida', 401)
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+def _selected_fields(available):
+    requested = request.args.get('fields')
+    if not requested:
+        return list(available)
+
+    names = [name.strip() for name in requested.split(',') if name.strip()]
+    if not names:
+        _error('Se debe indicar al menos un campo', 400, fields=list(available))
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        _error(f'Campos desconocidos: {", ".join(unknown)}', 400, fields=list(available))
+    return names
+
+
+def _int_arg(name):
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        _error(f'Valor inválido para {name}, se espera un número entero', 400)
+
+
+def _date_arg(name):
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        _error(f'Fecha inválida para {name}, se espera AAAA-MM-DD', 400)
+
+
+def _stream_rows(query, names):
+    """Serializa las filas del query como un arreglo JSON, en bloques de
+    API_BATCH_SIZE filas, sin cargar el resultado completo en memoria."""
+    batch_size = app.config['API_BATCH_SIZE']
+
+    def generate():
+        yield '['
+        separator = ''
+        batch = []
+        for row in query.yield_per(batch_size):
+            batch.append(_encoder.encode(dict(zip(names, row))))
+            if len(batch) == batch_size:
+                yield separator + ','.join(batch)
+                separator = ','
+                batch = []
+        if batch:
+            yield separator + ','.join(batch)
+        yield ']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def _room_query(names):
+    columns = [ROOM_FIELDS[name] for name in names]
+    return db.session.query(*columns).select_from(Room).join(RoomCategory, Room.category_id == RoomCategory.id)
+
+
+@app.route(f'{API_PREFIX}/rooms')
+@api_login_required
+@conditional('room', 'room_category')
+def api_rooms():
+    names = _selected_fields(ROOM_FIELDS)
+    query = _room_query(names)
+
+    status = request.args.get('status')
+    if status:
+        query = query.filter(Room.status == status)
+    category_id = _int_arg('category_id')
+    if category_id is not None:
+        query = query.filter(Room.category_id == category_id)
+
+    return _stream_rows(query.order_by(Room.id), names)
+
+
+@app.route(f'{API_PREFIX}/rooms/<int:room_id>')
+@api_login_required
+@conditional('room', 'room_category')
+def api_room(room_id):
+    names = _selected_fields(ROOM_FIELDS)
+    row = _room_query(names).filter(Room.id == room_id).first()
+    if row is None:
+        _error('Habitación no encontrada', 404)
+    return _json_response(dict(zip(names, row)))
+
+
+@app.route(f'{API_PREFIX}/categories')
+@api_login_required
+@conditional('room_category')
+def api_categories():
+    names = _selected_fields(CATEGORY_FIELDS)
+    query = db.session.query(*[CATEGORY_FIELDS[name] for name in names]).select_from(RoomCategory)
+    return _stream_rows(query.order_by(RoomCategory.id), names)
+
+
+@app.route(f'{API_PREFIX}/availability')
+@api_login_required
+@conditional('room', 'room_category', 'reservation')
+def api_availability():
+    names = _selected_fields(ROOM_FIELDS)
+    check_in = _date_arg('check_in')
+    check_out = _date_arg('check_out')
+    num_people = _int_arg('num_people')
+
+    if (check_in is None) != (check_out is None):
+        _error('Se deben indicar check_in y check_out juntos', 400)
+    if check_in is not None and check_in >= check_out:
+        _error('check_out debe ser posterior a check_in', 400)
+
+    # Sin fechas se informa el estado actual de la habitación. Con fechas solo
+    # se excluyen las deshabilitadas y las que tienen una reserva activa que se
+    # superpone, ya que 'Ocupado' se asigna ante cualquier reserva futura.
+    query = _room_query(names)
+    if num_people is not None:
+        query = query.filter(RoomCategory.max_capacity >= num_people)
+    if check_in is None:
+        query = query.filter(Room.status == 'Disponible')
+    else:
+        query = query.filter(Room.status != 'Deshabilitada')
+        overlapping = db.session.query(Reservation.room_id).filter(
+            Reservation.status == 'Activo',
+            Reservation.check_in < check_out,
+            Reservation.check_out > check_in,
+        )
+        query = query.filter(~Room.id.in_(overlapping))
+
+    return _stream_rows(query.order_by(Room.id), names)
+
+
+@app.route(f'{API_PREFIX}/reservations')
+@api_login_required
+def api_reservations():
+    names = _selected_fields(RESERVATION_FIELDS)
+    columns = [RESERVATION_FIELDS[name] for name in names]
+    query = db.session.query(*columns).select_from(Reservation).join(Room, Reservation.room_id == Room.id)
+
+    # Los huéspedes solo ven sus propias reservas
+    if current_user.role != 'admin':
+        query = query.filter(Reservation.user_id == current_user.id)
+    status = request.args.get('status')
+    if status:
+        query = query.filter(Reservation.status == status)
+
+    return _stream_rows(query.order_by(Reservation.id), names)
@@ -3,11 +3,21 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from datetime import datetime
+import os
 
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your_secret_key'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'mysql://root@localhost/gestion_hotel'  
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'mysql://root@localhost/gestion_hotel')
+app.config['FRAGMENT_CACHE_MAX_ENTRIES'] = 256
+app.config['FRAGMENT_CACHE_MAX_BYTES'] = 4 * 1024 * 1024
+app.config['ASSETS_BUILD_ON_STARTUP'] = False
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'application/json']
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_BROTLI_QUALITY'] = 5
+app.config['API_BATCH_SIZE'] = 500
+app.config['WARMUP_PATHS'] = ['/api/v1/rooms', '/api/v1/categories']
 db = SQLAlchemy(app)
 login_manager = LoginManager(app)
 
@@ -72,7 +82,8 @@ with app.app_context():
             number='101',
             category_id=default_category.id,  
             name='Default Room',
-            description='Default room description'
+            description='Default room description',
+            status='Disponible'
         )
         db.session.add(default_room)
         db.session.commit()
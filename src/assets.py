@@ -0,0 +1,162 @@
+# assets.py
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+
+from flask import request, send_from_directory
+
+from .app import app
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Los archivos generados se guardan en static/dist con el hash del contenido en
+# el nombre, por lo que pueden cachearse indefinidamente en el navegador.
+ASSETS_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+_manifest = {}
+
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    return source.replace(';}', '}').strip()
+
+
+def _write_file(path, data):
+    # Cada proceso escribe en su propio temporal para que dos builds simultáneos
+    # no publiquen un archivo a medio escribir
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def build_assets():
+    """Minifica y versiona las hojas de estilo de static/css, generando además
+    variantes gzip y brotli. Devuelve el manifiesto original -> versionado."""
+    static_folder = app.static_folder
+    output_root = os.path.join(static_folder, ASSETS_DIR)
+    manifest = {}
+    generated = set()
+
+    css_folder = os.path.join(static_folder, 'css')
+    for filename in sorted(os.listdir(css_folder)):
+        if not filename.endswith('.css'):
+            continue
+
+        with open(os.path.join(css_folder, filename), encoding='utf-8') as f:
+            data = minify_css(f.read()).encode('utf-8')
+
+        digest = hashlib.sha1(data).hexdigest()[:12]
+        stem = filename[:-len('.css')]
+        hashed_name = f'css/{stem}.{digest}.css'
+        output_path = os.path.join(output_root, hashed_name)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        variants = {output_path: lambda: data, output_path + '.gz': lambda: gzip.compress(data, 9, mtime=0)}
+        if brotli is not None:
+            variants[output_path + '.br'] = lambda: brotli.compress(data, quality=11)
+
+        for path, compress in variants.items():
+            if not os.path.exists(path):
+                _write_file(path, compress())
+            generated.add(path)
+
+        manifest[f'css/{filename}'] = f'{ASSETS_DIR}/{hashed_name}'
+
+    # Elimina versiones anteriores que ya no figuran en el manifiesto. Los
+    # .tmp pueden pertenecer a otro proceso que está generando los archivos.
+    for dirpath, _, filenames in os.walk(output_root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if filename != MANIFEST_NAME and not filename.endswith('.tmp') and path not in generated:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    _write_file(os.path.join(output_root, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    _manifest.clear()
+    _manifest.update(manifest)
+    return manifest
+
+
+def load_manifest():
+    path = os.path.join(app.static_folder, ASSETS_DIR, MANIFEST_NAME)
+    _manifest.clear()
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            _manifest.update(json.load(f))
+    return _manifest
+
+
+# url_for('static', filename='css/login.css') apunta a la versión con hash
+@app.url_defaults
+def _hashed_static_url(endpoint, values):
+    if endpoint == 'static':
+        filename = values.get('filename')
+        if filename in _manifest:
+            values['filename'] = _manifest[filename]
+
+
+def serve_static(filename):
+    if not filename.startswith(ASSETS_DIR + '/'):
+        return app.send_static_file(filename)
+
+    directory = os.path.join(app.static_folder, ASSETS_DIR)
+    name = filename[len(ASSETS_DIR) + 1:]
+    mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+
+    # Sirve la variante precomprimida que acepte el cliente, si existe
+    encoding = None
+    for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if request.accept_encodings[candidate] and os.path.isfile(os.path.join(directory, name + suffix)):
+            encoding = candidate
+            name += suffix
+            break
+
+    response = send_from_directory(directory, name, mimetype=mimetype)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    # Solo los nombres con hash del manifiesto nunca cambian de contenido
+    if filename in _manifest.values():
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+app.view_functions['static'] = serve_static
+
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    manifest = build_assets()
+    print(f'{len(manifest)} hojas de estilo generadas en static/{ASSETS_DIR}')
+
+
+# La generación normal se hace con 'flask build-assets' o desde serve.py antes
+# de bifurcar; si falla al iniciar (p. ej. static/ de solo lectura) se usa el
+# manifiesto existente.
+load_manifest()
+if app.config['ASSETS_BUILD_ON_STARTUP']:
+    try:
+        build_assets()
+    except OSError:
+        app.logger.exception('No se pudieron generar las hojas de estilo versionadas')
@@ -0,0 +1,229 @@
+# cache.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import wraps
+from multiprocessing import Value
+
+from flask import request, session, make_response
+from flask_login import current_user, login_user
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .app import app
+
+
+# Contadores de versión por tabla. Se crean en memoria compartida para que los
+# procesos hijos bifurcados desde el proceso principal vean los mismos valores.
+# La invalidación entre workers solo funciona si la aplicación se importa antes
+# de bifurcar (preload, como en serve.py): sin preload cada worker tiene sus
+# propios contadores y los demás seguirían sirviendo fragmentos y 304 obsoletos.
+# Los contadores vuelven a 0 en cada arranque, por eso BOOT_EPOCH forma parte
+# de cada ETag y un ETag de un arranque anterior nunca vuelve a coincidir.
+BOOT_EPOCH = f'{time.time_ns():x}'
+TRACKED_TABLES = ('user', 'room', 'room_category', 'reservation')
+_versions = {table: Value('q', 0) for table in TRACKED_TABLES}
+_modified = {table: Value('d', time.time()) for table in TRACKED_TABLES}
+
+
+def bump_version(table):
+    counter = _versions[table]
+    with counter.get_lock():
+        counter.value += 1
+    _modified[table].value = time.time()
+
+
+def table_version(*tables):
+    return tuple(_versions[table].value for table in tables)
+
+
+def last_modified(*tables):
+    return datetime.fromtimestamp(max(_modified[table].value for table in tables), timezone.utc)
+
+
+# Se registran las tablas modificadas en cada flush y solo se incrementan sus
+# versiones cuando la transacción se confirma.
+@event.listens_for(Session, 'after_flush')
+def _track_dirty_tables(session, flush_context):
+    dirty_tables = session.info.setdefault('dirty_tables', set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, '__tablename__', None)
+        if table in _versions:
+            dirty_tables.add(table)
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_dirty_tables(session):
+    for table in session.info.pop('dirty_tables', ()):
+        bump_version(table)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_dirty_tables(session):
+    session.info.pop('dirty_tables', None)
+
+
+class FragmentCache:
+    """Caché LRU de fragmentos renderizados, limitada por entradas y bytes."""
+
+    def __init__(self, max_entries=256, max_bytes=4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        size = len(value.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def render(self, key, renderer):
+        value = self.get(key)
+        if value is None:
+            value = renderer()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+fragment_cache = FragmentCache(
+    max_entries=app.config['FRAGMENT_CACHE_MAX_ENTRIES'],
+    max_bytes=app.config['FRAGMENT_CACHE_MAX_BYTES'],
+)
+
+
+# Roles por usuario, válidos mientras no cambie la versión de la tabla 'user'.
+# Evita cargar el usuario desde la base de datos para responder un 304.
+_roles = {}
+
+
+def current_role():
+    user_id = session.get('_user_id')
+    if user_id is None:
+        if app.config.get('REMEMBER_COOKIE_NAME', 'remember_token') not in request.cookies:
+            return 'anonymous'
+        return getattr(current_user, 'role', 'anonymous')
+
+    key = (user_id, table_version('user'))
+    role = _roles.get(key)
+    if role is None:
+        role = getattr(current_user, 'role', 'anonymous')
+        if len(_roles) >= 1024:
+            _roles.clear()
+        _roles[key] = role
+    return role
+
+
+def conditional(*tables):
+    """Agrega ETag/Last-Modified a la vista y responde 304 sin ejecutarla
+    cuando el cliente ya tiene la versión actual de `tables`."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            parts = (BOOT_EPOCH, request.full_path, current_role()) + table_version(*tables)
+            etag = hashlib.sha1('|'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+            # Solo se usa If-None-Match: el contenido depende del rol, que
+            # forma parte del ETag pero no de la fecha de modificación.
+            if request.method in ('GET', 'HEAD') and request.if_none_match.contains_weak(etag):
+                response = app.response_class(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+
+            if response.status_code in (200, 304):
+                response.set_etag(etag, weak=True)
+                response.last_modified = last_modified(*tables)
+                response.cache_control.private = True
+                response.cache_control.no_cache = True
+                response.vary.add('Cookie')
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+# Estado del precalentamiento; los workers lo heredan del proceso principal.
+warm_state = {'warmed_at': None, 'fragments': [], 'paths': []}
+
+# Listados de habitaciones (rol, filtro) que se renderizan al iniciar
+WARMUP_FRAGMENTS = (('guest', 'all'), ('guest', 'Disponible'), ('admin', 'all'))
+
+
+def warm_caches():
+    """Renderiza los listados de habitaciones de WARMUP_FRAGMENTS en la caché
+    de fragmentos y recorre WARMUP_PATHS para compilar plantillas y consultas
+    antes de atender tráfico real."""
+    from .models import User
+    from .routes import render_room_list
+
+    fragments = []
+    for role, status_filter in WARMUP_FRAGMENTS:
+        with app.test_request_context():
+            user = User.query.filter_by(role=role).first()
+            if user is None:
+                continue
+            login_user(user)
+            render_room_list(role, status_filter)
+        fragments.append(f'{role}:{status_filter}')
+
+    # La API requiere sesión: se usa la de un administrador
+    client = app.test_client()
+    with app.app_context():
+        admin = User.query.filter_by(role='admin').first()
+    if admin is not None:
+        with client.session_transaction() as sess:
+            sess['_user_id'] = admin.get_id()
+    paths = []
+    for path in app.config['WARMUP_PATHS']:
+        response = client.get(path)
+        response.get_data()
+        if response.status_code == 200:
+            paths.append(path)
+        response.close()
+
+    warm_state['warmed_at'] = time.time()
+    warm_state['fragments'] = fragments
+    warm_state['paths'] = paths
+    return fragments
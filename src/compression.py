@@ -0,0 +1,103 @@
+# compression.py
+import zlib
+
+from flask import request
+
+from .app import app
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _negotiate_encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+
+def _compressor(encoding):
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=app.config['COMPRESS_BROTLI_QUALITY'])
+        return compressor.process, compressor.finish
+
+    # wbits=31 genera el formato gzip en lugar de zlib
+    compressor = zlib.compressobj(app.config['COMPRESS_LEVEL'], zlib.DEFLATED, 31)
+    return compressor.compress, compressor.flush
+
+
+def _to_bytes(chunk):
+    return chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def _read_head(chunks, min_size):
+    """Lee del stream hasta reunir min_size bytes. Devuelve lo leído y si el
+    stream terminó antes de alcanzar ese tamaño."""
+    head = []
+    size = 0
+    for chunk in chunks:
+        chunk = _to_bytes(chunk)
+        head.append(chunk)
+        size += len(chunk)
+        if size >= min_size:
+            return b''.join(head), False
+    return b''.join(head), True
+
+
+def _compress_stream(head, chunks, compress, finish):
+    try:
+        data = compress(head)
+        if data:
+            yield data
+        for chunk in chunks:
+            data = compress(_to_bytes(chunk))
+            if data:
+                yield data
+        yield finish()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+@app.after_request
+def compress_response(response):
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in app.config['COMPRESS_MIMETYPES']):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = _negotiate_encoding()
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        # Se bufferiza el inicio del stream para aplicar el mismo umbral que a
+        # las respuestas completas; si termina antes se envía sin comprimir.
+        chunks = iter(response.response)
+        head, finished = _read_head(chunks, app.config['COMPRESS_MIN_SIZE'])
+        if finished:
+            response.set_data(head)
+            return response
+        compress, finish = _compressor(encoding)
+        response.response = _compress_stream(head, chunks, compress, finish)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < app.config['COMPRESS_MIN_SIZE']:
+            return response
+        compress, finish = _compressor(encoding)
+        response.set_data(compress(data) + finish())
+
+    response.headers['Content-Encoding'] = encoding
+
+    # Un ETag fuerte identifica los bytes exactos, que ahora son otros
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
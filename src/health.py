@@ -0,0 +1,50 @@
+# health.py
+import os
+
+from flask import jsonify
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .app import app, db
+from .cache import TRACKED_TABLES, fragment_cache, table_version, warm_state
+
+
+def _pool_state():
+    pool = db.engine.pool
+    state = {'class': type(pool).__name__, 'status': pool.status()}
+    for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+        if hasattr(pool, name):
+            state[name] = getattr(pool, name)()
+    return state
+
+
+# Indica que el proceso está vivo, sin consultar la base de datos
+@app.route('/health')
+def health():
+    return jsonify(status='ok', pid=os.getpid())
+
+
+# Indica si el worker puede atender tráfico: base de datos accesible y estado
+# de las cachés
+@app.route('/ready')
+def ready():
+    try:
+        db.session.execute(text('SELECT 1'))
+        database = 'ok'
+    except SQLAlchemyError as e:
+        database = f'error: {e.__class__.__name__}'
+
+    is_ready = database == 'ok'
+    return jsonify(
+        status='ok' if is_ready else 'unavailable',
+        pid=os.getpid(),
+        database=database,
+        pool=_pool_state(),
+        cache={
+            'fragments': fragment_cache.stats(),
+            'versions': dict(zip(TRACKED_TABLES, table_version(*TRACKED_TABLES))),
+            'warmed_at': warm_state['warmed_at'],
+            'warmed_fragments': warm_state['fragments'],
+            'warmed_paths': warm_state['paths'],
+        },
+    ), 200 if is_ready else 503
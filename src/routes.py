@@ -3,6 +3,8 @@ from flask_login import login_user, login_required, logout_user, current_user
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 from .app import app, db  
+from . import api, assets, compression, health
+from .cache import conditional, current_role, fragment_cache, table_version
 from .forms import AddRoomForm, AddUserForm, DeleteRoomForm, DeleteUserForm, EditReservationForm, EditRoomForm, EditUserForm, RegistrationForm, LoginForm, ReservationForm, CancelReservationForm, ManageRoomForm
 from .models import User, Room, RoomCategory, Reservation, Cancellation
 from flask_bcrypt import Bcrypt
@@ -195,25 +197,27 @@ def delete_user():
 
 
 # Rutas para habitaciones
+def render_room_list(role, status_filter):
+    def render():
+        query = Room.query if status_filter == 'all' else Room.query.filter_by(status=status_filter)
+        return render_template('rooms/list_rooms.html', rooms=query.all())
+
+    key = ('rooms/list_rooms.html', role, status_filter, table_version('room'))
+    return fragment_cache.render(key, render)
+
 @app.route('/rooms')
+@conditional('room')
 def list_rooms():
-    rooms = Room.query.all()
-    return render_template('rooms/list_rooms.html', rooms=rooms)
+    return render_room_list(current_role(), 'all')
 
 @app.route('/rooms/filter', methods=['POST'])
 @login_required
 def filter_rooms():
     status_filter = request.form.get('status')
     if current_user.role == 'admin':
-            if status_filter == 'all':
-                rooms = Room.query.all()
-            else:
-                rooms = Room.query.filter_by(status=status_filter).all()
-            return render_template('rooms/list_rooms.html', rooms=rooms)
+            return render_room_list('admin', status_filter)
     elif current_user.role == 'guest':
-        status_filter = 'Disponible'
-        rooms = Room.query.filter_by(status=status_filter).all()
-        return render_template('rooms/list_rooms.html', rooms=rooms)
+            return render_room_list('guest', 'Disponible')
     else:
             return redirect(url_for('home.html'))
 
@@ -0,0 +1,74 @@
+# serve.py
+# Punto de entrada de producción: python -m src.serve --workers 4 --threads 2
+import argparse
+import multiprocessing
+import os
+
+from gunicorn.app.base import BaseApplication
+
+from .app import app, db
+from .assets import build_assets
+from .cache import warm_caches
+
+
+def default_workers():
+    return int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+
+def post_fork(server, worker):
+    # Cada worker abre sus propias conexiones en lugar de compartir los sockets
+    # heredados del proceso principal
+    with app.app_context():
+        db.engine.dispose()
+
+
+class Server(BaseApplication):
+    """Servidor gunicorn preforking que reutiliza la aplicación ya cargada."""
+
+    def __init__(self, options):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Servidor de producción de Gestión de Hoteles')
+    parser.add_argument('--bind', default=os.environ.get('BIND', '0.0.0.0:8000'))
+    parser.add_argument('--workers', type=int, default=default_workers())
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('THREADS', 1)))
+    parser.add_argument('--timeout', type=int, default=30)
+    parser.add_argument('--no-warmup', action='store_true', help='No precalentar las cachés al iniciar')
+    args = parser.parse_args()
+
+    # La aplicación ya está importada; se generan las hojas de estilo y se
+    # precalientan las cachés una sola vez antes de bifurcar para que todos los
+    # workers las hereden. Con static/ de solo lectura se usa el manifiesto
+    # generado previamente con 'flask build-assets'.
+    try:
+        build_assets()
+    except OSError:
+        app.logger.exception('No se pudieron generar las hojas de estilo versionadas')
+    if not args.no_warmup:
+        warm_caches()
+    with app.app_context():
+        db.engine.dispose()
+
+    Server({
+        'bind': args.bind,
+        'workers': args.workers,
+        'threads': args.threads,
+        'timeout': args.timeout,
+        'preload_app': True,
+        'post_fork': post_fork,
+        'accesslog': '-',
+    }).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+
+from src.app import db
+from src.models import Reservation, Room, RoomCategory, User
+
+
+@pytest.fixture
+def client(client):
+    client.post('/login', data={'username': 'guest1', 'password': 'password1'})
+    return client
+
+
+@pytest.fixture
+def booked_room(app):
+    category = RoomCategory.query.first()
+    room = Room(number='701', category_id=category.id, name='Suite', description='', status='Ocupado')
+    db.session.add(room)
+    db.session.commit()
+
+    guest = User.query.filter_by(username='guest1').first()
+    reservation = Reservation(user_id=guest.id, check_in=datetime(2030, 3, 10), check_out=datetime(2030, 3, 15),
+                              room_id=room.id, num_people=1)
+    db.session.add(reservation)
+    db.session.commit()
+
+    yield room
+
+    db.session.delete(reservation)
+    db.session.delete(room)
+    db.session.commit()
+
+
+def _numbers(response):
+    return [room['number'] for room in response.get_json()]
+
+
+def test_rooms_field_selection(client):
+    response = client.get('/api/v1/rooms?fields=number,category')
+    assert response.status_code == 200
+    assert response.get_json()[0] == {'number': '101', 'category': 'Default'}
+
+
+@pytest.mark.parametrize('fields, message', [(',', 'al menos un campo'), ('number,price', 'price')])
+def test_rooms_invalid_fields(client, fields, message):
+    response = client.get(f'/api/v1/rooms?fields={fields}')
+    assert response.status_code == 400
+    assert message in response.get_json()['error']
+
+
+@pytest.mark.parametrize('path', [
+    '/api/v1/rooms?category_id=abc',
+    '/api/v1/availability?num_people=x',
+    '/api/v1/availability?check_in=2030-03-10',
+    '/api/v1/availability?check_in=2030-03-10&check_out=2030-03-01',
+])
+def test_invalid_arguments_return_400(client, path):
+    assert client.get(path).status_code == 400
+
+
+def test_availability_without_dates_uses_current_status(client, booked_room):
+    assert '701' not in _numbers(client.get('/api/v1/availability'))
+
+
+def test_availability_with_dates_uses_reservation_overlap(client, booked_room):
+    assert '701' in _numbers(client.get('/api/v1/availability?check_in=2030-03-01&check_out=2030-03-10'))
+    assert '701' not in _numbers(client.get('/api/v1/availability?check_in=2030-03-12&check_out=2030-03-20'))
+
+
+@pytest.mark.parametrize('path', [
+    '/api/v1/rooms',
+    '/api/v1/rooms/1',
+    '/api/v1/categories',
+    '/api/v1/availability',
+    '/api/v1/reservations',
+])
+def test_api_requires_authentication(app, path):
+    response = app.test_client().get(path)
+    assert response.status_code == 401
+    assert response.get_json()['error'] == 'Autenticación requerida'
+
+
+def test_guest_only_sees_own_reservations(client, booked_room):
+    reservations = client.get('/api/v1/reservations?fields=room_number').get_json()
+    assert reservations == [{'room_number': '701'}]
@@ -0,0 +1,91 @@
+import gzip
+
+import pytest
+from flask import url_for
+
+from src import assets
+from src.assets import brotli, build_assets, minify_css
+
+requires_brotli = pytest.mark.skipif(brotli is None, reason='brotli no está instalado')
+
+
+@pytest.fixture
+def static_folder(app, tmp_path, monkeypatch):
+    css = tmp_path / 'css'
+    css.mkdir()
+    (css / 'login.css').write_text('/* login.css */\nbody {\n    color: #333;\n}\n\na:hover {\n    color: red;\n}\n')
+    monkeypatch.setattr(app, 'static_folder', str(tmp_path))
+    yield tmp_path
+    assets._manifest.clear()
+
+
+def test_minify_css_removes_comments_and_whitespace():
+    source = '/* comentario */\n.a .b,\nul > li {\n    margin: 0 auto;\n    color: #fff;\n}\n'
+    assert minify_css(source) == '.a .b,ul>li{margin:0 auto;color:#fff}'
+
+
+def test_build_assets_writes_hashed_and_compressed_files(static_folder):
+    stale = static_folder / 'dist' / 'css' / 'login.old.css'
+    pending = static_folder / 'dist' / 'css' / 'other.css.tmp'
+    stale.parent.mkdir(parents=True)
+    stale.write_text('')
+    pending.write_text('')
+
+    manifest = build_assets()
+
+    hashed = manifest['css/login.css']
+    path = static_folder / hashed
+    data = path.read_bytes()
+    assert data == b'body{color:#333}a:hover{color:red}'
+    assert gzip.decompress((static_folder / f'{hashed}.gz').read_bytes()) == data
+    if brotli is not None:
+        assert brotli.decompress((static_folder / f'{hashed}.br').read_bytes()) == data
+    else:
+        assert not (static_folder / f'{hashed}.br').exists()
+    assert not stale.exists()
+    assert pending.exists()
+
+
+def test_url_for_static_points_to_hashed_file(app, static_folder):
+    manifest = build_assets()
+    with app.test_request_context():
+        assert url_for('static', filename='css/login.css') == f'/static/{manifest["css/login.css"]}'
+        assert url_for('static', filename='css/missing.css') == '/static/css/missing.css'
+
+
+@pytest.mark.parametrize('accept, encoding', [
+    pytest.param('br, gzip', 'br', marks=requires_brotli),
+    ('gzip', 'gzip'),
+    ('', None),
+])
+def test_hashed_assets_use_precompressed_variant(client, static_folder, accept, encoding):
+    hashed = build_assets()['css/login.css']
+    response = client.get(f'/static/{hashed}', headers={'Accept-Encoding': accept})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/css'
+    assert response.headers.get('Content-Encoding') == encoding
+    assert response.headers['Cache-Control'] == assets.IMMUTABLE_CACHE_CONTROL
+    assert 'Accept-Encoding' in response.headers['Vary']
+    response.close()
+
+
+def test_write_file_does_not_touch_other_temporary_files(tmp_path):
+    target = tmp_path / 'login.abc.css'
+    other = tmp_path / 'login.abc.css.tmp'
+    other.write_text('otro proceso')
+
+    assets._write_file(str(target), b'body{}')
+
+    assert target.read_bytes() == b'body{}'
+    assert other.read_text() == 'otro proceso'
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['login.abc.css', 'login.abc.css.tmp']
+
+
+def test_unhashed_dist_files_are_not_immutable(client, static_folder):
+    build_assets()
+    response = client.get('/static/dist/manifest.json')
+
+    assert response.status_code == 200
+    assert response.headers.get('Cache-Control') != assets.IMMUTABLE_CACHE_CONTROL
+    response.close()
@@ -0,0 +1,115 @@
+import pytest
+
+from src import cache
+from src.app import db
+from src.cache import FragmentCache, table_version
+from src.models import Room, RoomCategory
+
+
+@pytest.fixture
+def add_room(app):
+    rooms = []
+
+    def add(number):
+        category = RoomCategory.query.first()
+        room = Room(number=number, category_id=category.id, name=f'Room {number}', description='', status='Disponible')
+        db.session.add(room)
+        db.session.commit()
+        rooms.append(room)
+        return room
+
+    yield add
+
+    for room in rooms:
+        db.session.delete(room)
+    db.session.commit()
+
+
+def test_fragment_cache_evicts_least_recently_used_entry():
+    fragments = FragmentCache(max_entries=2)
+    fragments.set('a', 'A')
+    fragments.set('b', 'B')
+    fragments.get('a')
+    fragments.set('c', 'C')
+
+    assert fragments.get('a') == 'A'
+    assert fragments.get('b') is None
+    assert fragments.get('c') == 'C'
+
+
+def test_fragment_cache_respects_byte_limit():
+    fragments = FragmentCache(max_bytes=10)
+    fragments.set('a', 'x' * 6)
+    fragments.set('b', 'y' * 6)
+    fragments.set('c', 'z' * 11)
+
+    assert fragments.get('a') is None
+    assert fragments.get('b') == 'y' * 6
+    assert fragments.get('c') is None
+    assert fragments.stats()['bytes'] == 6
+
+
+def test_fragment_cache_render_only_calls_renderer_on_miss():
+    fragments = FragmentCache()
+    calls = []
+
+    def renderer():
+        calls.append(1)
+        return 'html'
+
+    assert fragments.render('key', renderer) == 'html'
+    assert fragments.render('key', renderer) == 'html'
+    assert len(calls) == 1
+
+
+def test_version_bumps_on_commit_but_not_on_rollback(app):
+    before = table_version('room_category')
+
+    db.session.add(RoomCategory(name='Rollback', description='', max_capacity=1))
+    db.session.flush()
+    db.session.rollback()
+    assert table_version('room_category') == before
+
+    category = RoomCategory(name='Commit', description='', max_capacity=1)
+    db.session.add(category)
+    db.session.commit()
+    assert table_version('room_category') == (before[0] + 1,)
+
+    db.session.delete(category)
+    db.session.commit()
+
+
+def test_list_rooms_conditional_get_cycle(client, add_room):
+    first = client.get('/rooms')
+    etag = first.headers['ETag']
+    assert first.status_code == 200
+    assert etag.startswith('W/')
+
+    cached = client.get('/rooms', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+
+    add_room('901')
+    refreshed = client.get('/rooms', headers={'If-None-Match': etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers['ETag'] != etag
+
+
+def test_etag_changes_with_boot_epoch(client, monkeypatch):
+    etag = client.get('/rooms').headers['ETag']
+    monkeypatch.setattr(cache, 'BOOT_EPOCH', 'otro-arranque')
+
+    response = client.get('/rooms', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_warm_caches_renders_room_lists_for_each_role(app):
+    cache.fragment_cache.clear()
+
+    fragments = cache.warm_caches()
+
+    assert fragments == ['guest:all', 'guest:Disponible', 'admin:all']
+    assert cache.warm_state['paths'] == app.config['WARMUP_PATHS']
+    for role, status_filter in cache.WARMUP_FRAGMENTS:
+        html = cache.fragment_cache.get(('rooms/list_rooms.html', role, status_filter, table_version('room')))
+        assert '101 - Disponible' in html
@@ -0,0 +1,63 @@
+import gzip
+
+import pytest
+from flask import Response
+
+from src.compression import brotli, compress_response
+
+BODY = '{"rooms":[' + ','.join(['{"number":"101","status":"Disponible"}'] * 50) + ']}'
+
+
+def _compress(app, accept, body=BODY, mimetype='application/json'):
+    with app.test_request_context(headers={'Accept-Encoding': accept}):
+        return compress_response(Response(body, mimetype=mimetype))
+
+
+@pytest.mark.skipif(brotli is None, reason='brotli no está instalado')
+def test_prefers_brotli_when_accepted(app):
+    response = _compress(app, 'gzip, br')
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.get_data()).decode() == BODY
+
+
+def test_falls_back_to_gzip(app):
+    response = _compress(app, 'gzip')
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()).decode() == BODY
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_skips_unsupported_encoding_small_bodies_and_other_mimetypes(app):
+    assert 'Content-Encoding' not in _compress(app, 'identity').headers
+    assert 'Content-Encoding' not in _compress(app, 'gzip', body='{}').headers
+    assert 'Content-Encoding' not in _compress(app, 'gzip', mimetype='image/png').headers
+
+
+def test_compresses_streamed_responses(app):
+    chunks = [BODY[:100], BODY[100:]]
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = compress_response(Response(iter(chunks), mimetype='application/json'))
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(b''.join(response.response)).decode() == BODY
+
+
+def test_strong_etag_becomes_weak(app):
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = Response(BODY, mimetype='application/json')
+        response.set_etag('abc')
+        response = compress_response(response)
+    assert response.get_etag() == ('abc', True)
+
+
+def test_small_streamed_responses_are_sent_uncompressed(app):
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = compress_response(Response(iter(['[', '1', ']']), mimetype='application/json'))
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_data() == b'[1]'
+
+
+def test_small_api_list_is_not_compressed(client):
+    client.post('/login', data={'username': 'guest1', 'password': 'password1'})
+    response = client.get('/api/v1/categories?fields=id', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_json()[0] == {'id': 1}
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src import cache
+from src.app import db
+
+
+def _fail(*args, **kwargs):
+    raise OperationalError('SELECT 1', {}, Exception('sin conexión'))
+
+
+def test_health_does_not_touch_database(client, monkeypatch):
+    monkeypatch.setattr(db.session, 'execute', _fail)
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'ok'
+
+
+def test_ready_returns_503_when_database_is_unavailable(client, monkeypatch):
+    monkeypatch.setattr(db.session, 'execute', _fail)
+    response = client.get('/ready')
+    assert response.status_code == 503
+    assert response.get_json()['database'] == 'error: OperationalError'
+
+
+def test_ready_reports_warm_up_state(client):
+    cache.warm_caches()
+    body = client.get('/ready').get_json()
+
+    assert body['status'] == 'ok'
+    assert body['cache']['warmed_fragments'] == ['guest:all', 'guest:Disponible', 'admin:all']
+    assert body['cache']['warmed_paths'] == ['/api/v1/rooms', '/api/v1/categories']
+    assert body['cache']['fragments']['entries'] >= 3
+
+
+def test_post_fork_disposes_engine(app, monkeypatch):
+    serve = pytest.importorskip('src.serve', exc_type=ImportError)
+    calls = []
+    monkeypatch.setattr(db.engine, 'dispose', lambda *args, **kwargs: calls.append(args))
+
+    serve.post_fork(server=None, worker=None)
+
+    assert calls == [()]